@@ -1,7 +1,7 @@
-from contextlib import contextmanager, nullcontext, AbstractContextManager
+from contextlib import contextmanager
 import re
 import threading
-from typing import ClassVar, Dict, Iterator, Tuple, Type, TypeVar, Any
+from typing import ClassVar, Dict, Iterator, Optional, Tuple, Type, TypeVar
 
 from dlt.common.configuration.specs.base_configuration import ContainerInjectableContext
 from dlt.common.configuration.exceptions import (
@@ -10,6 +10,10 @@ from dlt.common.configuration.exceptions import (
 )
 
 TConfiguration = TypeVar("TConfiguration", bound=ContainerInjectableContext)
+TInjectionToken = Tuple[
+    ContainerInjectableContext, Optional[ContainerInjectableContext], Optional[threading.Lock]
+]
+"""Injected context, the context it replaced and a lock held for the time of injection"""
 
 
 class Container:
@@ -136,11 +140,21 @@ class Container:
     ) -> Iterator[TConfiguration]:
         """A context manager that will insert `config` into the container and restore the previous value when it gets out of scope."""
 
+        token = self._push_context(config, lock_context=lock_context)
+        try:
+            yield config
+        finally:
+            self._pop_context(token)
+
+    def _push_context(self, config: TConfiguration, lock_context: bool = False) -> TInjectionToken:
+        """Inserts `config` into the container and returns a token that `_pop_context` uses to restore the previous value.
+
+        Non context manager counterpart of `injectable_context` to be used on hot paths with explicit try/finally
+        """
         config.resolve()
         spec = type(config)
-        previous_config: ContainerInjectableContext = None
         context = self._thread_context(spec)
-        lock: AbstractContextManager[Any]
+        lock: threading.Lock = None
 
         # if there is a lock_id, we need a lock for the lock_id in the scope of the current context
         if lock_context:
@@ -148,27 +162,32 @@ class Container:
             if (lock := self._context_container_locks.get(lock_key)) is None:
                 with Container._LOCK:
                     self._context_container_locks[lock_key] = lock = threading.Lock()
-        else:
-            lock = nullcontext()
-
-        with lock:
-            # remember context and set item
-            previous_config = context.get(spec)
-            self._thread_setitem(context, spec, config)
-            try:
-                yield config
-            finally:
-                # before setting the previous config for given spec, check if there was no overlapping modification
-                context, current_config = self._thread_getitem(spec)
-                if current_config is config:
-                    # config is injected for spec so restore previous
-                    if previous_config is None:
-                        self._thread_delitem(context, spec)
-                    else:
-                        self._thread_setitem(context, spec, previous_config)
+            lock.acquire()
+
+        # remember context and set item
+        previous_config = context.get(spec)
+        self._thread_setitem(context, spec, config)
+        return config, previous_config, lock
+
+    def _pop_context(self, token: TInjectionToken) -> None:
+        """Restores the context that was replaced by `_push_context` and releases the lock if it was acquired"""
+        config, previous_config, lock = token
+        spec = type(config)
+        try:
+            # before setting the previous config for given spec, check if there was no overlapping modification
+            context, current_config = self._thread_getitem(spec)
+            if current_config is config:
+                # config is injected for spec so restore previous
+                if previous_config is None:
+                    self._thread_delitem(context, spec)
                 else:
-                    # value was modified in the meantime and not restored
-                    raise ContainerInjectableContextMangled(spec, context[spec], config)
+                    self._thread_setitem(context, spec, previous_config)
+            else:
+                # value was modified in the meantime and not restored
+                raise ContainerInjectableContextMangled(spec, context[spec], config)
+        finally:
+            if lock is not None:
+                lock.release()
 
     @staticmethod
     def thread_pool_prefix() -> str:
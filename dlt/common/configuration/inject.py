@@ -1,13 +1,29 @@
 import inspect
 
-from functools import wraps
-from typing import Callable, Dict, Type, Any, Optional, Tuple, TypeVar, overload, cast
+from types import ModuleType
+from typing import (
+    Callable,
+    Dict,
+    List,
+    Set,
+    Type,
+    Any,
+    Optional,
+    Tuple,
+    TypeVar,
+    overload,
+    cast,
+)
 from inspect import Signature, Parameter
-from contextlib import nullcontext
-
-from dlt.common.typing import DictStrAny, StrAny, TFun, AnyFun
-from dlt.common.configuration.resolve import resolve_configuration, inject_section
-from dlt.common.configuration.specs.base_configuration import BaseConfiguration
+from weakref import WeakKeyDictionary
+
+from dlt.common.typing import DictStrAny, StrAny, TFun, AnyFun, is_final_type
+from dlt.common.configuration.resolve import resolve_configuration, _push_section, _pop_section
+from dlt.common.configuration.specs.base_configuration import (
+    BaseConfiguration,
+    extract_inner_hint,
+    is_base_configuration_inner_hint,
+)
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
 
 from dlt.common.reflection.spec import spec_from_signature
@@ -15,14 +31,41 @@ from dlt.common.reflection.spec import spec_from_signature
 
 _LAST_DLT_CONFIG = "_dlt_config"
 _ORIGINAL_ARGS = "_dlt_orig_args"
-# keep a registry of all the decorated functions
-_FUNC_SPECS: Dict[int, Type[BaseConfiguration]] = {}
+# attributes of the decorated function copied to the wrapper
+_WRAPPER_ASSIGNMENTS = ("__module__", "__name__", "__qualname__", "__doc__", "__annotations__")
+# attribute of the decorated function and its wrapper that holds the function and its SPEC
+_FUNC_SPEC_ATTR = "__dlt_spec__"
+# registry of the decorated callables that do not accept attributes ie. bound methods and built-ins,
+# entries are dropped together with the callables
+_FUNC_SPECS: "WeakKeyDictionary[AnyFun, Type[BaseConfiguration]]" = WeakKeyDictionary()
+# imported on first use, logger cannot be imported at module load due to circular imports
+_logger: ModuleType = None
 
 TConfiguration = TypeVar("TConfiguration", bound=BaseConfiguration)
 
 
 def get_fun_spec(f: AnyFun) -> Type[BaseConfiguration]:
-    return _FUNC_SPECS.get(id(f))
+    fun_spec: Tuple[AnyFun, Type[BaseConfiguration]] = getattr(f, _FUNC_SPEC_ATTR, None)
+    # attribute may be copied to other function ie. by functools.wraps, or read from the function
+    # of a bound method, so it is valid only for the exact object it was set on
+    if fun_spec is not None and fun_spec[0] is f:
+        return fun_spec[1]
+    try:
+        return _FUNC_SPECS.get(f)
+    except TypeError:
+        # callables that cannot be weak referenced are never registered
+        return None
+
+
+def _register_fun_spec(f: AnyFun, SPEC: Type[BaseConfiguration]) -> None:
+    try:
+        setattr(f, _FUNC_SPEC_ATTR, (f, SPEC))
+    except AttributeError:
+        # bound methods and built-ins do not accept attributes
+        try:
+            _FUNC_SPECS[f] = SPEC
+        except TypeError:
+            pass
 
 
 @overload
@@ -97,9 +140,6 @@ def with_config(
         SPEC: Type[BaseConfiguration] = None
         sig: Signature = inspect.signature(f)
         signature_fields: Dict[str, Any]
-        kwargs_arg = next(
-            (p for p in sig.parameters.values() if p.kind == Parameter.VAR_KEYWORD), None
-        )
         if spec is None:
             SPEC, signature_fields = spec_from_signature(f, sig, include_defaults, base=base)
         else:
@@ -109,131 +149,318 @@ def with_config(
         # if no signature fields were added we will not wrap `f` for injection
         if len(signature_fields) == 0:
             # always register new function
-            _FUNC_SPECS[id(f)] = SPEC
+            _register_fun_spec(f, SPEC)
             return f
 
+        # names and hints of the fields that are injected from resolved SPEC
+        spec_hints = SPEC.get_resolvable_fields()
+
         spec_arg: Parameter = None
         pipeline_name_arg: Parameter = None
-
+        kwargs_arg: Parameter = None
+        # arguments of `f` that are injected from SPEC fields and arguments that receive SPEC instance
+        injected_names: List[str] = []
+        spec_param_names: List[str] = []
+        # binding tables used to bind call arguments without `Signature.bind`
+        positional_names: List[str] = []
+        keyword_names: Set[str] = set()
+        kw_only_names: List[str] = []
+        required_names: List[str] = []
+        var_positional_name: str = None
+
+        # collect all argument info in a single pass
         for p in sig.parameters.values():
+            if p.kind in (Parameter.POSITIONAL_ONLY, Parameter.POSITIONAL_OR_KEYWORD):
+                positional_names.append(p.name)
+            elif p.kind == Parameter.KEYWORD_ONLY:
+                kw_only_names.append(p.name)
+            elif p.kind == Parameter.VAR_POSITIONAL:
+                var_positional_name = p.name
+            elif p.kind == Parameter.VAR_KEYWORD:
+                kwargs_arg = p
+            if p.kind in (Parameter.POSITIONAL_OR_KEYWORD, Parameter.KEYWORD_ONLY):
+                keyword_names.add(p.name)
+                if p.default == Parameter.empty:
+                    required_names.append(p.name)
+            elif p.kind == Parameter.POSITIONAL_ONLY and p.default == Parameter.empty:
+                required_names.append(p.name)
             # for all positional parameters that do not have default value, set default
             # if hasattr(SPEC, p.name) and p.default == Parameter.empty:
             #     p._default = None  # type: ignore
+            if p.name in spec_hints:
+                injected_names.append(p.name)
             if p.annotation is SPEC:
                 # if any argument has type SPEC then us it to take initial value
                 spec_arg = p
+                spec_param_names.append(p.name)
             if p.name == "pipeline_name" and auto_pipeline_section:
                 # if argument has name pipeline_name and auto_section is used, use it to generate section context
                 pipeline_name_arg = p
                 pipeline_name_arg_default = None if p.default == Parameter.empty else p.default
 
-        def resolve_config(bound_args: inspect.BoundArguments) -> BaseConfiguration:
-            """Resolve arguments using the provided spec"""
-            # bind parameters to signature
-            # for calls containing resolved spec in the kwargs, we do not need to resolve again
-            config: BaseConfiguration = None
-
-            # if section derivation function was provided then call it
-            if section_f:
-                curr_sections: Tuple[str, ...] = (section_f(bound_args.arguments),)
-                # sections may be a string
-            elif isinstance(sections, str):
-                curr_sections = (sections,)
-            else:
-                curr_sections = sections
-
-            # if one of arguments is spec the use it as initial value
-            if initial_config:
-                config = initial_config
-            elif spec_arg:
-                config = bound_args.arguments.get(spec_arg.name, None)
-            # resolve SPEC, also provide section_context with pipeline_name
-            if pipeline_name_arg:
-                curr_pipeline_name = bound_args.arguments.get(
-                    pipeline_name_arg.name, pipeline_name_arg_default
-                )
-            else:
-                curr_pipeline_name = None
-            section_context = ConfigSectionContext(
-                pipeline_name=curr_pipeline_name,
-                sections=curr_sections,
-                merge_style=sections_merge_style,
+        # SPEC fields passed as arguments of `f` and the remaining ones, frozen for the per call loops
+        injected_field_names = tuple(injected_names)
+        rest_field_names = tuple(name for name in spec_hints if name not in injected_field_names)
+        positional_count = len(positional_names)
+        kwargs_arg_name = kwargs_arg.name if kwargs_arg else None
+
+        def bind_arguments(args: Tuple[Any, ...], kwargs: DictStrAny) -> DictStrAny:
+            """Binds `args` and `kwargs` to names of the arguments of `f` like `Signature.bind(...).arguments`.
+
+            Only the membership checks are done, in case of invalid arguments `Signature.bind` is called to raise TypeError
+            """
+            if len(args) > positional_count and var_positional_name is None:
+                sig.bind(*args, **kwargs)
+            arguments = dict(zip(positional_names, args))
+            if len(args) > positional_count:
+                arguments[var_positional_name] = args[positional_count:]
+            if kwargs:
+                var_kwargs: DictStrAny = {}
+                for k, v in kwargs.items():
+                    if k in keyword_names:
+                        if k in arguments:
+                            sig.bind(*args, **kwargs)
+                        arguments[k] = v
+                    elif kwargs_arg_name is not None:
+                        var_kwargs[k] = v
+                    else:
+                        sig.bind(*args, **kwargs)
+                if var_kwargs:
+                    arguments[kwargs_arg_name] = var_kwargs
+            for name in required_names:
+                if name not in arguments:
+                    sig.bind(*args, **kwargs)
+            return arguments
+
+        def call_f(arguments: DictStrAny) -> Any:
+            """Calls `f` with bound `arguments`, equivalent of `f(*bound_args.args, **bound_args.kwargs)`"""
+            f_args: List[Any] = []
+            f_kwargs: DictStrAny = {}
+            # positional arguments after the first missing one must be passed as keywords
+            positional = True
+            for name in positional_names:
+                if name in arguments:
+                    if positional:
+                        f_args.append(arguments[name])
+                    else:
+                        f_kwargs[name] = arguments[name]
+                else:
+                    positional = False
+            if positional and var_positional_name in arguments:
+                f_args.extend(arguments[var_positional_name])
+            for name in kw_only_names:
+                if name in arguments:
+                    f_kwargs[name] = arguments[name]
+            if kwargs_arg_name in arguments:
+                f_kwargs.update(arguments[kwargs_arg_name])
+            return f(*f_args, **f_kwargs)
+
+        # resolution may be skipped when all injectable arguments are passed explicitly and it
+        # would not transform them: no embedded configs, final or dynamic hints, no resolve hooks,
+        # SPEC fields are all arguments of `f` and config instance is not passed to `f`
+        can_skip_resolve = (
+            kwargs_arg is None
+            and not spec_param_names
+            and not initial_config
+            and len(injected_names) == len(spec_hints)
+            and not SPEC.__hint_resolvers__
+            and not any(
+                is_final_type(hint) or is_base_configuration_inner_hint(extract_inner_hint(hint))
+                for hint in spec_hints.values()
+            )
+            and not any(
+                "on_resolved" in c.__dict__ or "on_partial" in c.__dict__ for c in SPEC.__mro__
             )
+        )
+        # injected argument names with their positions, -1 for keyword only
+        injected_positions = tuple(
+            (name, positional_names.index(name) if name in positional_names else -1)
+            for name in injected_names
+        )
 
-            # this may be called from many threads so section_context is thread affine
-            with inject_section(section_context, lock_context=lock_context_on_injection):
-                # print(f"RESOLVE CONF in inject: {f.__name__}: {section_context.sections} vs {sections}")
-                return resolve_configuration(
-                    config or SPEC(),
-                    explicit_value=bound_args.arguments,
-                    accept_partial=accept_partial,
+        def all_injected_passed(args: Tuple[Any, ...], kwargs: DictStrAny) -> bool:
+            """Tells if all injectable arguments were passed explicitly. None values are injected"""
+            for name, position in injected_positions:
+                if 0 <= position < len(args):
+                    if args[position] is None:
+                        return False
+                elif kwargs.get(name) is None:
+                    return False
+            return True
+
+        # name of the argument holding initial value of the config, initial_config takes precedence
+        spec_arg_name = None if initial_config or spec_arg is None else spec_arg.name
+
+        # sections may be a string
+        static_sections: Tuple[str, ...] = (sections,) if isinstance(sections, str) else sections
+
+        # select resolver at decoration time so only the parts that depend on call arguments
+        # are evaluated per call
+        if section_f is None and pipeline_name_arg is None:
+
+            def resolve_config(arguments: DictStrAny) -> BaseConfiguration:
+                """Resolve arguments using the provided spec and sections known at decoration time"""
+                # if one of arguments is spec the use it as initial value
+                config = initial_config or (arguments.get(spec_arg_name) if spec_arg_name else None)
+                # NOTE: arguments are constant but instance cannot be created once: it is merged with the
+                # existing context in place and kept in the container during resolution (possibly in many threads)
+                section_context = ConfigSectionContext(
+                    sections=static_sections, merge_style=sections_merge_style
                 )
+                # this may be called from many threads so section_context is thread affine
+                token = _push_section(section_context, lock_context=lock_context_on_injection)
+                try:
+                    return resolve_configuration(
+                        config or SPEC(), explicit_value=arguments, accept_partial=accept_partial
+                    )
+                finally:
+                    _pop_section(token)
+
+        else:
+
+            def resolve_config(arguments: DictStrAny) -> BaseConfiguration:
+                """Resolve arguments using the provided spec, derive sections and pipeline name from arguments"""
+                # if section derivation function was provided then call it
+                if section_f:
+                    curr_sections: Tuple[str, ...] = (section_f(arguments),)
+                else:
+                    curr_sections = static_sections
+
+                # if one of arguments is spec the use it as initial value
+                config = initial_config or (arguments.get(spec_arg_name) if spec_arg_name else None)
+                # resolve SPEC, also provide section_context with pipeline_name
+                if pipeline_name_arg:
+                    curr_pipeline_name = arguments.get(
+                        pipeline_name_arg.name, pipeline_name_arg_default
+                    )
+                else:
+                    curr_pipeline_name = None
+                section_context = ConfigSectionContext(
+                    pipeline_name=curr_pipeline_name,
+                    sections=curr_sections,
+                    merge_style=sections_merge_style,
+                )
+
+                # this may be called from many threads so section_context is thread affine
+                token = _push_section(section_context, lock_context=lock_context_on_injection)
+                try:
+                    # print(f"RESOLVE CONF in inject: {f.__name__}: {section_context.sections} vs {sections}")
+                    return resolve_configuration(
+                        config or SPEC(), explicit_value=arguments, accept_partial=accept_partial
+                    )
+                finally:
+                    _pop_section(token)
+
+        def split_config_values(config: BaseConfiguration) -> Tuple[DictStrAny, DictStrAny]:
+            """Splits values of `config` into arguments of `f` and the rest that goes to variadic kwargs"""
+            if type(config) is SPEC:
+                # all SPEC fields are present, read them directly without iterating the config
+                injected = {name: getattr(config, name) for name in injected_field_names}
+                if kwargs_arg is None:
+                    resolved_params: DictStrAny = {}
+                else:
+                    resolved_params = {name: getattr(config, name) for name in rest_field_names}
+            else:
+                # config passed in spec argument may be of any type
+                resolved_params = dict(config)
+                injected = {
+                    name: resolved_params.pop(name)
+                    for name in sig.parameters
+                    if name in resolved_params
+                }
+            for name in spec_param_names:
+                injected[name] = config
+            return injected, resolved_params
 
         def update_bound_args(
-            bound_args: inspect.BoundArguments, config: BaseConfiguration, args: Any, kwargs: Any
+            arguments: DictStrAny,
+            config: BaseConfiguration,
+            injected: StrAny,
+            resolved_params: StrAny,
+            args: Any,
+            kwargs: Any,
         ) -> None:
             # overwrite or add resolved params
-            resolved_params = dict(config)
-            # overwrite or add resolved params
-            for p in sig.parameters.values():
-                if p.name in resolved_params:
-                    bound_args.arguments[p.name] = resolved_params.pop(p.name)
-                if p.annotation is SPEC:
-                    bound_args.arguments[p.name] = config
+            arguments.update(injected)
             # pass all other config parameters into kwargs if present
             if kwargs_arg is not None:
-                if kwargs_arg.name not in bound_args.arguments:
+                if kwargs_arg.name not in arguments:
                     # add variadic keyword argument
-                    bound_args.arguments[kwargs_arg.name] = {}
-                bound_args.arguments[kwargs_arg.name].update(resolved_params)
-                bound_args.arguments[kwargs_arg.name][_LAST_DLT_CONFIG] = config
-                bound_args.arguments[kwargs_arg.name][_ORIGINAL_ARGS] = (args, kwargs)
+                    arguments[kwargs_arg.name] = {}
+                arguments[kwargs_arg.name].update(resolved_params)
+                arguments[kwargs_arg.name][_LAST_DLT_CONFIG] = config
+                arguments[kwargs_arg.name][_ORIGINAL_ARGS] = (args, kwargs)
 
         def with_partially_resolved_config(config: Optional[BaseConfiguration] = None) -> Any:
             # creates a pre-resolved partial of the decorated function
-            empty_bound_args = sig.bind_partial()
             if not config:
-                config = resolve_config(empty_bound_args)
+                config = resolve_config({})
+            # config values do not change between calls so split them into arguments once, keep
+            # all in a tuple so they are replaced together
+            resolved = (config, *split_config_values(config))
 
             def wrapped(*args: Any, **kwargs: Any) -> Any:
-                nonlocal config
+                nonlocal resolved
 
                 # Do we need an exception here?
                 if spec_arg and spec_arg.name in kwargs:
-                    from dlt.common import logger
+                    global _logger
+                    if _logger is None:
+                        from dlt.common import logger as _logger
 
-                    logger.warning(
+                    _logger.warning(
                         "Spec argument is provided in kwargs, ignoring it for resolved partial"
                         " function."
                     )
 
                 # we can still overwrite the config
                 if _LAST_DLT_CONFIG in kwargs:
-                    config = last_config(**kwargs)
+                    if (new_config := kwargs[_LAST_DLT_CONFIG]) is not resolved[0]:
+                        resolved = (new_config, *split_config_values(new_config))
 
                 # call the function with the pre-resolved config
-                bound_args = sig.bind(*args, **kwargs)
-                update_bound_args(bound_args, config, args, kwargs)
-                return f(*bound_args.args, **bound_args.kwargs)
+                arguments = bind_arguments(args, kwargs)
+                update_bound_args(arguments, *resolved, args, kwargs)
+                return call_f(arguments)
 
             return wrapped
 
-        @wraps(f)
-        def _wrap(*args: Any, **kwargs: Any) -> Any:
-            # Resolve config
-            config: BaseConfiguration = None
-            bound_args = sig.bind(*args, **kwargs)
-            if _LAST_DLT_CONFIG in kwargs:
-                config = last_config(**kwargs)
-            else:
-                config = resolve_config(bound_args)
+        def _wrap_resolve(*args: Any, **kwargs: Any) -> Any:
+            arguments = bind_arguments(args, kwargs)
+            # for calls containing resolved spec in the kwargs, we do not need to resolve again
+            config: BaseConfiguration = kwargs.get(_LAST_DLT_CONFIG)
+            if config is None:
+                # Resolve config
+                config = resolve_config(arguments)
 
             # call the function with resolved config
-            update_bound_args(bound_args, config, args, kwargs)
-            return f(*bound_args.args, **bound_args.kwargs)
+            update_bound_args(arguments, config, *split_config_values(config), args, kwargs)
+            return call_f(arguments)
+
+        def _wrap_explicit(*args: Any, **kwargs: Any) -> Any:
+            # nothing to inject
+            if all_injected_passed(args, kwargs):
+                return f(*args, **kwargs)
+            return _wrap_resolve(*args, **kwargs)
+
+        # select wrapper at decoration time, like resolver above
+        _wrap = _wrap_explicit if can_skip_resolve else _wrap_resolve
+
+        # copy only the attributes of `f` that are used instead of full `functools.wraps`
+        for attr in _WRAPPER_ASSIGNMENTS:
+            try:
+                setattr(_wrap, attr, getattr(f, attr))
+            except AttributeError:
+                # callable instances ie. do not have names
+                pass
+        # keep attributes set on `f` before decoration
+        _wrap.__dict__.update(getattr(f, "__dict__", {}))
+        # inspect.signature follows __wrapped__
+        _wrap.__wrapped__ = f  # type: ignore[attr-defined]
 
         # register the spec for a wrapped function
-        _FUNC_SPECS[id(_wrap)] = SPEC
+        _register_fun_spec(_wrap, SPEC)
+        _register_fun_spec(f, SPEC)
 
         # add a method to create a pre-resolved partial
         setattr(_wrap, "__RESOLVED_PARTIAL_FUNC__", with_partially_resolved_config)  # noqa: B010
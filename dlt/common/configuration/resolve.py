@@ -25,7 +25,7 @@ from dlt.common.configuration.specs.base_configuration import (
 from dlt.common.configuration.specs.config_section_context import ConfigSectionContext
 from dlt.common.configuration.specs.exceptions import NativeValueError
 from dlt.common.configuration.specs.config_providers_context import ConfigProvidersContext
-from dlt.common.configuration.container import Container
+from dlt.common.configuration.container import Container, TInjectionToken
 from dlt.common.configuration.utils import log_traces, deserialize_value
 from dlt.common.configuration.exceptions import (
     LookupTrace,
@@ -116,6 +116,24 @@ def inject_section(
     return container.injectable_context(section_context, lock_context=lock_context)
 
 
+def _push_section(
+    section_context: ConfigSectionContext, merge_existing: bool = True, lock_context: bool = False
+) -> TInjectionToken:
+    """Same as `inject_section` but without context manager. Returns a token that must be passed to `_pop_section`
+    to restore previous section context. Used in hot paths ie. `with_config` decorator.
+    """
+    container = Container()
+    if merge_existing:
+        section_context.merge(container[ConfigSectionContext])
+
+    return container._push_context(section_context, lock_context=lock_context)
+
+
+def _pop_section(token: TInjectionToken) -> None:
+    """Restores section context replaced by `_push_section`"""
+    Container()._pop_context(token)
+
+
 def _maybe_parse_native_value(
     config: TConfiguration, explicit_value: Any, embedded_sections: Tuple[str, ...]
 ) -> Any:
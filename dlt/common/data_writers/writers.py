@@ -123,9 +123,10 @@ class JsonlWriter(DataWriter):
 
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
-        for row in rows:
-            json.dump(row, self._f)
-            self._f.write(b"\n")
+        # serialize all rows and write them at once, each write to a (compressed) file is costly
+        lines = [json.dumpb(row) for row in rows]
+        lines.append(b"")
+        self._f.write(b"\n".join(lines))
 
     def write_footer(self) -> None:
         pass
@@ -183,33 +184,27 @@ class InsertValuesWriter(DataWriter):
 
     def write_data(self, rows: Sequence[Any]) -> None:
         super().write_data(rows)
+        headers_lookup = self._headers_lookup
+        escape_literal = self._caps.escape_literal
 
-        def write_row(row: StrAny, last_row: bool = False) -> None:
-            output = ["NULL"] * len(self._headers_lookup)
+        def format_row(row: StrAny) -> str:
+            output = ["NULL"] * len(headers_lookup)
             for n, v in row.items():
-                output[self._headers_lookup[n]] = self._caps.escape_literal(v)
-            if self._caps.insert_values_writer_type == "default":
-                self._f.write("(")
-                self._f.write(",".join(output))
-                self._f.write(")")
-                if not last_row:
-                    self._f.write(",\n")
-            elif self._caps.insert_values_writer_type == "select_union":
-                self._f.write("SELECT ")
-                self._f.write(",".join(output))
-                if not last_row:
-                    self._f.write("\nUNION ALL\n")
+                output[headers_lookup[n]] = escape_literal(v)
+            return ",".join(output)
+
+        # format all rows of the chunk and write them at once
+        if self._caps.insert_values_writer_type == "select_union":
+            chunk = "\nUNION ALL\n".join(["SELECT " + format_row(row) for row in rows])
+        else:
+            chunk = ",\n".join(["(" + format_row(row) + ")" for row in rows])
 
         # if next chunk add separator
         if self._chunks_written > 0:
             self._f.write(",\n")
 
-        # write rows
-        for row in rows[:-1]:
-            write_row(row)
-
-        # write last row without separator so we can write footer eventually
-        write_row(rows[-1], last_row=True)
+        # last row is written without separator so we can write footer eventually
+        self._f.write(chunk)
         self._chunks_written += 1
 
     def write_footer(self) -> None:
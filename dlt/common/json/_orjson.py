@@ -55,7 +55,8 @@ def load(fp: IO[bytes]) -> Any:
 
 
 def loads(s: str) -> Any:
-    return orjson.loads(s.encode("utf-8"))
+    # orjson reads str directly, without intermediary encoded copy
+    return orjson.loads(s)
 
 
 def loadb(s: Union[bytes, bytearray, memoryview]) -> Any:
@@ -5,7 +5,6 @@ import threading
 
 import datetime  # noqa: 251
 import humanize
-from pathlib import Path
 from pendulum.datetime import DateTime
 from typing import (
     ClassVar,
@@ -132,8 +131,8 @@ class ParsedLoadJobFileName(NamedTuple):
 
     @staticmethod
     def parse(file_name: str) -> "ParsedLoadJobFileName":
-        p = Path(file_name)
-        parts = p.name.split(".")
+        # os.path is much faster than constructing a Path, the parser is used on every job file
+        parts = os.path.basename(file_name).split(".")
         if len(parts) != 4:
             raise TerminalValueError(parts)
 
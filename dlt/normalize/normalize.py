@@ -2,9 +2,9 @@ import os
 import datetime  # noqa: 251
 import itertools
 from typing import Callable, List, Dict, NamedTuple, Sequence, Tuple, Set, Optional
-from concurrent.futures import Future, Executor
+from concurrent.futures import FIRST_COMPLETED, Future, Executor, wait
 
-from dlt.common import logger, sleep
+from dlt.common import logger
 from dlt.common.configuration import with_config, known_sections
 from dlt.common.configuration.accessors import config
 from dlt.common.configuration.container import Container
@@ -34,7 +34,6 @@ from dlt.common.pipeline import (
 )
 from dlt.common.storages.exceptions import LoadPackageNotFound
 from dlt.common.storages.load_package import LoadPackageInfo
-from dlt.common.utils import chunks
 
 from dlt.normalize.configuration import NormalizeConfiguration
 from dlt.normalize.exceptions import NormalizeJobFailed
@@ -192,16 +191,17 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         # sort files so the same tables are in the same worker
         files = list(sorted(files))
 
-        chunk_size = max(len(files) // no_groups, 1)
-        chunk_files = list(chunks(files, chunk_size))
-        # distribute the remainder files to existing groups starting from the end
-        remainder_l = len(chunk_files) - no_groups
-        l_idx = 0
-        while remainder_l > 0:
-            for idx, file in enumerate(reversed(chunk_files.pop())):
-                chunk_files[-l_idx - idx - remainder_l].append(file)  # type: ignore
-            remainder_l -= 1
-            l_idx = idx + 1
+        chunk_size, remainder_l = divmod(len(files), no_groups)
+        if chunk_size == 0:
+            # less files than groups, one file per group
+            return [[file] for file in files]
+        # split into contiguous groups, the remainder files extend the groups at the end by one
+        chunk_files: List[Sequence[str]] = []
+        start = 0
+        for idx in range(no_groups):
+            end = start + chunk_size + (1 if idx >= no_groups - remainder_l else 0)
+            chunk_files.append(files[start:end])
+            start = end
         return chunk_files
 
     def map_parallel(self, schema: Schema, load_id: str, files: Sequence[str]) -> TWorkerRV:
@@ -228,7 +228,11 @@ class Normalize(Runnable[Executor], WithStepInfo[NormalizeMetrics, NormalizeInfo
         ]
 
         while len(tasks) > 0:
-            sleep(0.3)
+            # wake up as soon as any task completes, tasks of small packages do not wait for polling
+            # interval. still check for signals periodically
+            signals.raise_if_signalled()
+            wait([pending for pending, _ in tasks], timeout=0.3, return_when=FIRST_COMPLETED)
+            signals.raise_if_signalled()
             # operate on copy of the list
             for task in list(tasks):
                 pending, params = task
@@ -149,6 +149,28 @@ def test_container_injectable_context_mangled(
     assert py_ex.value.expected_config == context
 
 
+@pytest.mark.parametrize("spec", (InjectableTestContext, GlobalTestContext))
+def test_container_push_pop_context(
+    container: Container, spec: Type[InjectableTestContext]
+) -> None:
+    original = container[spec]
+    context = spec()
+    token = container._push_context(context, lock_context=True)
+    assert container[spec] is context
+    lock = token[2]
+    assert lock.locked()
+    container._pop_context(token)
+    assert container[spec] is original
+    assert not lock.locked()
+
+    # lock is released also when context got mangled
+    token = container._push_context(spec(), lock_context=True)
+    container[spec] = spec()
+    with pytest.raises(ContainerInjectableContextMangled):
+        container._pop_context(token)
+    assert not token[2].locked()
+
+
 @pytest.mark.parametrize("spec", (InjectableTestContext, GlobalTestContext))
 def test_container_thread_affinity(container: Container, spec: Type[InjectableTestContext]) -> None:
     event = threading.Semaphore(0)
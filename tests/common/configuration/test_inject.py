@@ -1,9 +1,13 @@
+import functools
+import gc
 import os
-from typing import Any, Dict, Optional, Type, Union
+import weakref
+from typing import Any, Dict, Optional, Type, Union, get_type_hints
 import pytest
 import time, threading
 import dlt
 
+from dlt.common.configuration import inject
 from dlt.common.configuration.exceptions import ConfigFieldMissingException
 from dlt.common.configuration.inject import (
     get_fun_spec,
@@ -124,6 +128,63 @@ def test_inject_secret_value_secret_type(environment: Any) -> None:
     f_custom_secret_type()
 
 
+def test_inject_binds_arguments(environment: Any) -> None:
+    environment["X"] = "7"
+
+    @with_config
+    def f_kinds(a, /, b, *args, c=1, x: int = dlt.config.value, **kwargs):
+        extra = {k: v for k, v in kwargs.items() if not k.startswith("_dlt")}
+        return a, b, args, c, x, extra
+
+    assert f_kinds(1, 2) == (1, 2, (), 1, 7, {})
+    assert f_kinds(1, 2, 3, 4, c=5, z=6) == (1, 2, (3, 4), 5, 7, {"z": 6})
+    # positional only argument name goes to kwargs
+    assert f_kinds(1, b=2, a=9) == (1, 2, (), 1, 7, {"a": 9})
+    assert f_kinds(1, 2, x=8) == (1, 2, (), 1, 8, {})
+
+    # invalid calls raise like the undecorated function
+    with pytest.raises(TypeError):
+        f_kinds()  # type: ignore[call-arg]
+    with pytest.raises(TypeError):
+        f_kinds(1, 2, b=3)  # type: ignore[misc]
+
+    @with_config
+    def f_no_var(a, x: int = dlt.config.value):
+        return a, x
+
+    assert f_no_var(1) == f_no_var(a=1) == (1, 7)
+    with pytest.raises(TypeError):
+        f_no_var(1, 2, 3)  # type: ignore[call-arg]
+    with pytest.raises(TypeError):
+        f_no_var(1, y=3)  # type: ignore[call-arg]
+
+
+def test_inject_skips_resolve_on_explicit_args(monkeypatch: pytest.MonkeyPatch) -> None:
+    @with_config
+    def f_var(user=dlt.config.value, path="a/b/c"):
+        return user, path
+
+    @with_config
+    def f_kwargs(user=dlt.config.value, path="a/b/c", **kwargs):
+        return last_config(**kwargs)
+
+    def _fail_resolve(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("resolve_configuration called")
+
+    monkeypatch.setattr(inject, "resolve_configuration", _fail_resolve)
+    # all injectable args are explicit
+    assert f_var("user", "path") == ("user", "path")
+    assert f_var(path="path", user="user") == ("user", "path")
+    # default or None values must be resolved
+    with pytest.raises(AssertionError):
+        f_var("user")
+    with pytest.raises(AssertionError):
+        f_var("user", None)
+    # functions receiving the config are always resolved
+    with pytest.raises(AssertionError):
+        f_kwargs("user", "path")
+
+
 @pytest.mark.skip("not implemented")
 def test_inject_with_non_injectable_param() -> None:
     # one of parameters in signature has not valid hint and is skipped (ie. from_pipe)
@@ -154,6 +215,60 @@ def test_inject_with_auto_section(environment: Any) -> None:
     assert hasattr(get_fun_spec(f), "pipeline_name")
 
 
+def test_wrapper_keeps_function_attrs() -> None:
+    def f(api_key: str = dlt.secrets.value, limit: int = 10) -> int:
+        """Docstring"""
+        return limit
+
+    f.custom = 1  # type: ignore[attr-defined]
+    wrapped = with_config(f)
+    assert wrapped.__annotations__ == f.__annotations__
+    assert get_type_hints(wrapped) == {"api_key": str, "limit": int, "return": int}
+    assert wrapped.__name__ == "f"
+    assert wrapped.__doc__ == "Docstring"
+    assert wrapped.custom == 1  # type: ignore[attr-defined]
+    assert wrapped.__wrapped__ is f  # type: ignore[attr-defined]
+
+
+def test_fun_spec_registry() -> None:
+    @with_config
+    def f(value=dlt.config.value):
+        return value
+
+    spec = get_fun_spec(f)
+    assert spec is not None
+    # undecorated function is registered as well
+    assert get_fun_spec(f.__wrapped__) is spec  # type: ignore[attr-defined]
+    # not decorated callables do not have spec
+    assert get_fun_spec(lambda: None) is None
+    # built-ins and bound methods do not accept attributes but are registered
+    assert get_fun_spec(with_config(len)) is not None
+
+    class Obj:
+        def method(self, items: Any) -> Any:
+            return items
+
+    obj = Obj()
+    assert get_fun_spec(obj.method) is None
+    method = with_config(obj.method)
+    assert get_fun_spec(method) is not None
+    # spec of the bound method is not visible on the function
+    assert get_fun_spec(Obj.method) is None
+
+    # functions wrapped with functools.wraps do not report inner spec
+    def outer(*args: Any, **kwargs: Any) -> Any:
+        return f(*args, **kwargs)
+
+    assert get_fun_spec(functools.wraps(f)(outer)) is None
+    del outer
+
+    # spec does not keep decorated functions alive
+    f_ref = weakref.ref(f)
+    del f
+    gc.collect()
+    assert f_ref() is None
+
+
 @pytest.mark.skip("not implemented")
 def test_inject_with_spec() -> None:
     pass
@@ -268,6 +383,19 @@ def test_partial() -> None:
     assert new_partial() == "new_val"
     assert partial() == "first_val"
 
+    @with_config(sections=("test",))
+    def test_sections_kwargs(value=dlt.config.value, **kwargs):
+        return value
+
+    os.environ["TEST__VALUE"] = "first_val"
+    partial = create_resolved_partial(test_sections_kwargs)
+    del os.environ["TEST__VALUE"]
+    assert partial() == "first_val"
+    # config passed explicitly replaces the pre-resolved one
+    other_config = get_fun_spec(test_sections_kwargs)()
+    other_config.value = "other_val"  # type: ignore[attr-defined]
+    assert partial(_dlt_config=other_config) == "other_val"
+
 
 def test_base_spec() -> None:
     @configspec
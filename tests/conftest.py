@@ -39,7 +39,10 @@ def pytest_configure(config):
     from dlt.common.configuration.specs import run_configuration
     from dlt.common.storages import configuration as storage_configuration
 
+    # must be the same as TEST_STORAGE_ROOT in tests/utils.py
     test_storage_root = "_storage"
+    if "PYTEST_XDIST_WORKER" in os.environ:
+        test_storage_root = os.path.join(test_storage_root, os.environ["PYTEST_XDIST_WORKER"])
     run_configuration.RunConfiguration.config_files_storage_path = os.path.join(
         test_storage_root, "config/"
     )
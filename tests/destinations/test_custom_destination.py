@@ -158,6 +158,20 @@ def test_instantiation() -> None:
     # local func does not create entry in destinations
     assert not _DESTINATIONS
 
+    # test passing bound method, it does not accept attributes
+    class SinkObj:
+        def sink(self, items: TDataItems, table: TTableSchema) -> None:
+            calls.append((items, table))
+
+    calls = []
+    sink_obj = SinkObj()
+    sink_destination = dlt.destinations.destination(destination_callable=sink_obj.sink)
+    assert sink_destination.spec is not None
+    p = dlt.pipeline("sink_test", destination=sink_destination, full_refresh=True)
+    p.run([1, 2], table_name="items")
+    assert len(calls) == 1
+    assert calls[0][0] == [{"value": 1}, {"value": 2}]
+
     # test passing string reference
     global global_calls
     global_calls = []
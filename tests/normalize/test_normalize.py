@@ -1,6 +1,7 @@
+import os
+import shutil
 import pytest
-from fnmatch import fnmatch
-from typing import Dict, Iterator, List, Sequence, Tuple
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
 
 # from multiprocessing import get_start_method, Pool
 # from multiprocessing.dummy import Pool as ThreadPool
@@ -12,7 +13,8 @@ from dlt.common.storages.exceptions import SchemaNotFoundError
 from dlt.common.utils import uniq_id
 from dlt.common.typing import StrAny
 from dlt.common.data_types import TDataType
-from dlt.common.storages import NormalizeStorage, LoadStorage, ParsedLoadJobFileName, PackageStorage
+from dlt.common.storages import NormalizeStorage, LoadStorage, ParsedLoadJobFileName
+from dlt.common.data_writers import DataWriter
 from dlt.common.destination import DestinationCapabilitiesContext
 from dlt.common.configuration.container import Container
 
@@ -25,7 +27,7 @@ from tests.utils import (
     TEST_DICT_CONFIG_PROVIDER,
     MockPipeline,
     assert_no_dict_key_starts_with,
-    clean_test_storage,
+    TEST_STORAGE_ROOT,
     init_test_logging,
 )
 from tests.normalize.utils import (
@@ -55,6 +57,20 @@ def caps(request) -> Iterator[DestinationCapabilitiesContext]:
         yield _caps
 
 
+@pytest.fixture(scope="module")
+def process_pool() -> Iterator[ProcessPoolExecutor]:
+    # use real process pool in tests, shared by all tests in the module to start workers once
+    # NOTE: workers receive all configurations and the schema with each task
+    with ProcessPoolExecutor(max_workers=4) as p:
+        yield p
+
+
+@pytest.fixture(scope="module")
+def thread_pool() -> Iterator[ThreadPoolExecutor]:
+    with ThreadPoolExecutor(max_workers=1) as p:
+        yield p
+
+
 @pytest.fixture()
 def raw_normalize() -> Iterator[Normalize]:
     # does not install default schemas, so no type hints and row filters
@@ -70,14 +86,24 @@ def rasa_normalize() -> Iterator[Normalize]:
 
 
 def init_normalize(default_schemas_path: str = None) -> Iterator[Normalize]:
-    clean_test_storage()
-    # pass schema config fields to schema storage via dict config provider
+    # each instance gets fresh storage so the whole test storage does not need to be deleted
+    storage_root = os.path.join(TEST_STORAGE_ROOT, "normalize_" + uniq_id())
+    # pass storage and schema config fields to storages via dict config provider
     with TEST_DICT_CONFIG_PROVIDER().values(
-        {"import_schema_path": default_schemas_path, "external_schema_format": "json"}
+        {
+            "normalize_volume_path": os.path.join(storage_root, "normalize"),
+            "load_volume_path": os.path.join(storage_root, "load"),
+            "schema_volume_path": os.path.join(storage_root, "schemas"),
+            "import_schema_path": default_schemas_path,
+            "external_schema_format": "json",
+        }
     ):
         # inject the destination capabilities
         n = Normalize()
-        yield n
+        try:
+            yield n
+        finally:
+            shutil.rmtree(storage_root, ignore_errors=True)
 
 
 @pytest.fixture(scope="module", autouse=True)
@@ -123,7 +149,6 @@ def test_normalize_single_user_event_jsonl(
 def test_normalize_single_user_event_insert(
     caps: DestinationCapabilitiesContext, raw_normalize: Normalize
 ) -> None:
-    # mock_destination_caps(raw_normalize, caps)
     expected_tables, load_files = normalize_event_user(
         raw_normalize, "event.event.user_load_1", EXPECTED_USER_TABLES
     )
@@ -212,8 +237,7 @@ def test_preserve_slot_complex_value_insert(
     )
     event_text, lines = get_line_from_file(rasa_normalize.load_storage, load_files["event_slot"], 2)
     assert lines == 3
-    c_val = json.dumps({"user_id": "world", "mitter_id": "hello"})
-    assert c_val in event_text
+    assert EXPECTED_SLOT_VALUE in event_text
 
 
 @pytest.mark.parametrize("caps", INSERT_CAPS, indirect=True)
@@ -266,12 +290,12 @@ def test_normalize_raw_type_hints(
 
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_multiprocessing_row_counting(
-    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+    caps: DestinationCapabilitiesContext,
+    raw_normalize: Normalize,
+    process_pool: ProcessPoolExecutor,
 ) -> None:
     extract_cases(raw_normalize, ["github.events.load_page_1_duck"])
-    # use real process pool in tests
-    with ProcessPoolExecutor(max_workers=4) as p:
-        raw_normalize.run(p)
+    raw_normalize.run(process_pool)
     # get step info
     step_info = raw_normalize.get_step_info(MockPipeline("multiprocessing_pipeline", True))  # type: ignore[abstract]
     assert step_info.row_counts["events"] == 100
@@ -287,7 +311,9 @@ def test_multiprocessing_row_counting(
 
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_many_packages(
-    caps: DestinationCapabilitiesContext, rasa_normalize: Normalize
+    caps: DestinationCapabilitiesContext,
+    rasa_normalize: Normalize,
+    process_pool: ProcessPoolExecutor,
 ) -> None:
     extract_cases(
         rasa_normalize,
@@ -302,9 +328,7 @@ def test_normalize_many_packages(
             "ethereum.blocks.9c1d9b504ea240a482b007788d5cd61c_2",
         ],
     )
-    # use real process pool in tests
-    with ProcessPoolExecutor(max_workers=4) as p:
-        rasa_normalize.run(p)
+    rasa_normalize.run(process_pool)
     # must have two loading groups with model and event schemas
     loads = rasa_normalize.load_storage.list_normalized_packages()
     assert len(loads) == 2
@@ -326,11 +350,10 @@ def test_normalize_many_packages(
 
 @pytest.mark.parametrize("caps", ALL_CAPABILITIES, indirect=True)
 def test_normalize_typed_json(
-    caps: DestinationCapabilitiesContext, raw_normalize: Normalize
+    caps: DestinationCapabilitiesContext, raw_normalize: Normalize, thread_pool: ThreadPoolExecutor
 ) -> None:
     extract_items(raw_normalize.normalize_storage, [JSON_TYPED_DICT], Schema("special"), "special")
-    with ThreadPoolExecutor(max_workers=1) as pool:
-        raw_normalize.run(pool)
+    raw_normalize.run(thread_pool)
     loads = raw_normalize.load_storage.list_normalized_packages()
     assert len(loads) == 1
     # load all schemas
@@ -460,7 +483,7 @@ def test_normalize_retry(raw_normalize: Normalize) -> None:
 
 
 def test_group_worker_files() -> None:
-    files = ["f%03d" % idx for idx in range(0, 100)]
+    files = [f"f{idx:03d}" for idx in range(0, 100)]
 
     assert Normalize.group_worker_files([], 4) == []
     assert Normalize.group_worker_files(["f001"], 1) == [["f001"]]
@@ -480,21 +503,25 @@ def test_group_worker_files() -> None:
     ]
     assert Normalize.group_worker_files(files[:8], 3) == [
         ["f000", "f001"],
-        ["f002", "f003", "f006"],
-        ["f004", "f005", "f007"],
+        ["f002", "f003", "f004"],
+        ["f005", "f006", "f007"],
     ]
     assert Normalize.group_worker_files(files[:5], 3) == [
         ["f000"],
-        ["f001", "f003"],
-        ["f002", "f004"],
+        ["f001", "f002"],
+        ["f003", "f004"],
     ]
+    # all files are assigned
+    groups = Normalize.group_worker_files(files, 7)
+    assert len(groups) == 7
+    assert [file for group in groups for file in group] == files
 
     # check if sorted
     files = ["tab1.1", "chd.3", "tab1.2", "chd.4", "tab1.3"]
     assert Normalize.group_worker_files(files, 3) == [
         ["chd.3"],
-        ["chd.4", "tab1.2"],
-        ["tab1.1", "tab1.3"],
+        ["chd.4", "tab1.1"],
+        ["tab1.2", "tab1.3"],
     ]
 
 
@@ -524,6 +551,9 @@ EXPECTED_USER_TABLES = [
     "event__parse_data__response_selector__default__response__responses",
 ]
 
+# complex slot value as serialized by both json implementations
+EXPECTED_SLOT_VALUE = '{"user_id":"world","mitter_id":"hello"}'
+
 
 def extract_items(
     normalize_storage: NormalizeStorage, items: Sequence[StrAny], schema: Schema, table_name: str
@@ -566,17 +596,23 @@ def normalize_pending(normalize: Normalize) -> str:
     return load_id
 
 
+# parsed json cases, shared by all tests in the module. items are only read by the extractor
+_CASE_CACHE: Dict[str, Any] = {}
+
+
 def extract_cases(normalize: Normalize, cases: Sequence[str]) -> str:
     items: List[StrAny] = []
     for case in cases:
         # our cases have schema and table name encoded in file name
         schema_name, table_name, _ = case.split(".", maxsplit=3)
-        with open(json_case_path(case), "rb") as f:
-            item = json.load(f)
-            if isinstance(item, list):
-                items.extend(item)
-            else:
-                items.append(item)
+        if case not in _CASE_CACHE:
+            with open(json_case_path(case), "rb") as f:
+                _CASE_CACHE[case] = json.loadb(f.read())
+        item = _CASE_CACHE[case]
+        if isinstance(item, list):
+            items.extend(item)
+        else:
+            items.append(item)
     # we assume that all items belonged to a single schema
     return extract_items(
         normalize.normalize_storage,
@@ -609,44 +645,53 @@ def expect_load_package(
         schema.naming.shorten_fragments(*schema.naming.break_path(table))
         for table in expected_tables
     ]
+    expected_tables_set = set(expected_tables)
 
     # find jobs and processed files
     files = load_storage.list_new_jobs(load_id)
-    files_tables = [ParsedLoadJobFileName.parse(file).table_name for file in files]
-    assert set(files_tables) == set(expected_tables)
-    ofl: Dict[str, List[str]] = {}
-    for expected_table in expected_tables:
-        # find all files for particular table, ignoring file id
-        file_mask = PackageStorage.build_job_file_name(
-            expected_table,
-            "*",
-            validate_components=False,
-            loader_file_format=load_storage.loader_file_format,
-        )
-        # files are in normalized/<load_id>/new_jobs
-        file_path = load_storage.normalized_packages.get_job_file_path(
-            load_id, "new_jobs", file_mask
-        )
-        candidates = [f for f in files if fnmatch(f, file_path)]
-        # assert len(candidates) == 1
-        ofl[expected_table] = candidates
+    parsed_files = [(file, ParsedLoadJobFileName.parse(file)) for file in files]
+    assert {parsed.table_name for _, parsed in parsed_files} == expected_tables_set
+    # find all new files for particular table, ignoring file id
+    file_extension = DataWriter.data_format_from_file_format(
+        load_storage.loader_file_format
+    ).file_extension
+    ofl: Dict[str, List[str]] = {expected_table: [] for expected_table in expected_tables}
+    for file, parsed in parsed_files:
+        if parsed.retry_count == 0 and parsed.file_format == file_extension:
+            ofl[parsed.table_name].append(file)
     # get the schema update
     schema_update = load_storage.begin_schema_update(load_id)
     if full_schema_update:
-        assert set(expected_tables) == set(schema_update.keys())
+        assert expected_tables_set == schema_update.keys()
     else:
-        assert set(expected_tables) >= set(schema_update.keys())
+        assert expected_tables_set >= schema_update.keys()
     return expected_tables, ofl
 
 
 def get_line_from_file(
     load_storage: LoadStorage, loaded_files: List[str], return_line: int = 0
 ) -> Tuple[str, int]:
-    lines = []
+    # count lines on bytes, load files are line oriented, decode only the requested one
+    line: str = None
+    count = 0
     for file in loaded_files:
-        with load_storage.normalized_packages.storage.open_file(file) as f:
-            lines.extend(f.readlines())
-    return lines[return_line], len(lines)
+        # load files are usually compressed so they cannot be mapped into memory
+        with load_storage.normalized_packages.storage.open_file(file, "rb") as f:
+            data: bytes = f.read()
+        file_lines = data.count(b"\n")
+        if data and not data.endswith(b"\n"):
+            # last line without line end
+            file_lines += 1
+        if line is None and return_line < count + file_lines:
+            start = 0
+            for _ in range(return_line - count):
+                start = data.index(b"\n", start) + 1
+            end = data.find(b"\n", start)
+            line = data[start : None if end == -1 else end + 1].decode("utf-8")
+        count += file_lines
+    if line is None:
+        raise IndexError(f"line {return_line} not found, {count} lines in files")
+    return line, count
 
 
 def assert_timestamp_data_type(load_storage: LoadStorage, data_type: TDataType) -> None:
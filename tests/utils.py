@@ -29,6 +29,9 @@ from dlt.common.utils import custom_environ, uniq_id
 from dlt.common.pipeline import PipelineContext, SupportsPipeline
 
 TEST_STORAGE_ROOT = "_storage"
+# when tests run in parallel with pytest-xdist, each worker gets its own storage
+if "PYTEST_XDIST_WORKER" in environ:
+    TEST_STORAGE_ROOT = os.path.join(TEST_STORAGE_ROOT, environ["PYTEST_XDIST_WORKER"])
 
 
 # destination constants